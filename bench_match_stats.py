@@ -0,0 +1,96 @@
+# bench_match_stats.py
+"""
+Benchmark for the match statistics store.
+
+Generates a synthetic tournament of several thousand matches, ingests it into
+a temporary MatchStore and times the queries exposed by the match_stats CLI.
+
+    python bench_match_stats.py --matches 5000
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from config import STARTING_LIFE_TOTAL
+from match_stats import MatchStore
+
+SYNTHETIC_DECKS = ["Boros Aggro", "Azorius Control", "Golgari Midrange", "Izzet Tempo",
+                   "Mono Red", "Dimir Rogues", "Selesnya Tokens", "Rakdos Sacrifice"]
+CARDS_PER_DECK = 15
+
+
+def synthetic_records(n_matches, seed=0):
+    """
+    Build n_matches random two-player match records in the format produced by
+    match_stats.build_match_record.
+    """
+    rng = random.Random(seed)
+    deck_cards = {deck: [f"{deck} Card {i}" for i in range(CARDS_PER_DECK)] for deck in SYNTHETIC_DECKS}
+    records = []
+    for match in range(n_matches):
+        turns = rng.randint(4, 14)
+        players = []
+        for seat in range(2):
+            deck = rng.choice(SYNTHETIC_DECKS)
+            life = STARTING_LIFE_TOTAL
+            curve = []
+            cards = []
+            for turn in range(1, turns + 1):
+                life -= rng.randint(0, 4)
+                curve.append(life)
+                drawn = rng.choice(deck_cards[deck])
+                cards.append((turn, drawn, "draw"))
+                if rng.random() < 0.7:
+                    cards.append((turn, drawn, "play"))
+            players.append({
+                "player_name": f"Player {match % 256}-{seat}",
+                "deck_name": deck,
+                "life": curve,
+                "cards": cards,
+            })
+        records.append({"turns": turns, "players": players})
+    return records
+
+
+def timed(label, func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the match statistics store.")
+    parser.add_argument("--matches", type=int, default=5000, help="Number of synthetic matches.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per query (best time is reported).")
+    args = parser.parse_args()
+
+    records = synthetic_records(args.matches)
+    store_path = tempfile.mkdtemp(prefix="match_stats_bench_")
+    try:
+        start = time.perf_counter()
+        MatchStore(store_path).append_matches(records)
+        print(f"{'Ingest ' + str(args.matches) + ' matches':<40} {(time.perf_counter() - start) * 1000:>10.2f} ms")
+
+        start = time.perf_counter()
+        store = MatchStore(store_path)
+        store.tables()
+        print(f"{'Open store and load chunks':<40} {(time.perf_counter() - start) * 1000:>10.2f} ms")
+
+        deck = SYNTHETIC_DECKS[0]
+        timed("average_life_at_turn(turn=5)", lambda: store.average_life_at_turn(deck, 5), args.repeat)
+        timed("life_curve", lambda: store.life_curve(deck), args.repeat)
+        timed("deck_summary", store.deck_summary, args.repeat)
+        timed("card_stats(deck)", lambda: store.card_stats(deck), args.repeat)
+        timed("card_stats(all decks)", store.card_stats, args.repeat)
+        timed("append_match (single, partial chunk)", lambda: store.append_match(records[0]), args.repeat)
+    finally:
+        shutil.rmtree(store_path)
+
+
+if __name__ == "__main__":
+    main()
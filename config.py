@@ -54,6 +54,15 @@ DEBUG_MODE = True
 # Log file path for application logs
 LOG_FILE = "app.log"
 
+# --------------------------
+# Match Statistics
+# --------------------------
+# Directory holding the columnar match statistics store (see match_stats.py)
+STATS_PATH = "./stats/"
+
+# Number of matches stored per on-disk chunk file
+STATS_CHUNK_MATCHES = 1024
+
 # --------------------------
 # Assets and Resource Paths
 # --------------------------
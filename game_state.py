@@ -1,13 +1,21 @@
 # game_state.py
 """
 This module defines the GameState class, which acts as the central repository 
-for all game information (player hands and life totals). It uses PyQt signals
-to notify other parts of the application when changes occur.
+for all game information (player hands, life totals and the current turn). It
+uses PyQt signals to notify other parts of the application when changes occur.
+
+Every change is also appended to an event log so that the match can be
+recorded to the statistics store (see match_stats.py) once it is over.
 """
 
 from PyQt5.QtCore import QObject, pyqtSignal
 from config import STARTING_LIFE_TOTAL
 
+# Event kinds stored in GameState.events
+EVENT_DRAW = "draw"
+EVENT_PLAY = "play"
+EVENT_LIFE = "life"
+
 class GameState(QObject):
     # Signal emitted whenever the game state is updated
     state_updated = pyqtSignal()
@@ -21,20 +29,32 @@ class GameState(QObject):
         """
         super().__init__()
         # Use the provided player names as keys
+        self.player_names = list(player_names)
         self.hands = {name: [] for name in player_names}
         self.life_totals = {name: STARTING_LIFE_TOTAL for name in player_names}
+        self.turn = 1
+        # Chronological log of (turn, player, kind, value) tuples, where value
+        # is the card name for draw/play events and the new life total for life events.
+        self.events = []
     
     def add_card(self, player, card_name):
         if player in self.hands:
             self.hands[player].append(card_name)
+            self.events.append((self.turn, player, EVENT_DRAW, card_name))
             self.state_updated.emit()
     
     def play_card(self, player, card_name):
         if player in self.hands and card_name in self.hands[player]:
             self.hands[player].remove(card_name)
+            self.events.append((self.turn, player, EVENT_PLAY, card_name))
             self.state_updated.emit()
     
     def update_life(self, player, new_life):
         if player in self.life_totals:
             self.life_totals[player] = new_life
+            self.events.append((self.turn, player, EVENT_LIFE, new_life))
             self.state_updated.emit()
+
+    def next_turn(self):
+        self.turn += 1
+        self.state_updated.emit()
@@ -20,15 +20,19 @@ Main entry point for the Live Game Overlay and Input System.
       - A vertical list of cards in hand
 
 Each overlay window is frameless and draggable.
+
+5. When the application closes, records the match to the statistics store
+   (see match_stats.py).
 """
 
 import sys
 from PyQt5.QtWidgets import QApplication
-from config import PLAYER_WINDOW_WIDTH, PLAYER_WINDOW_HEIGHT, OVERLAY_WINDOW_WIDTH, OVERLAY_WINDOW_HEIGHT
+from config import PLAYER_WINDOW_WIDTH, PLAYER_WINDOW_HEIGHT, OVERLAY_WINDOW_WIDTH, OVERLAY_WINDOW_HEIGHT, STATS_PATH
 from game_state import GameState
 from player_window import PlayerWindow
 from overlay_window import PlayerOverlayWindow
 from setup_dialog import SetupDialog
+from match_stats import MatchStore, build_match_record
 from utils import init_logger
 
 logger = init_logger()
@@ -81,7 +85,17 @@ def main():
         logger.debug("Created overlay window for %s", player_name)
 
     logger.debug("All overlay windows created and displayed")
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+
+    # Record the match to the statistics store if anything happened.
+    if game_state.events:
+        try:
+            MatchStore(STATS_PATH).append_match(build_match_record(game_state, players_info))
+            logger.debug("Match recorded to %s", STATS_PATH)
+        except OSError:
+            logger.exception("Failed to record match to %s", STATS_PATH)
+
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
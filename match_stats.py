@@ -0,0 +1,423 @@
+# match_stats.py
+"""
+Columnar on-disk store for per-match statistics.
+
+At the end of each match the GameState event log is turned into a match record
+(see build_match_record) and appended to a store directory. The store keeps
+three tables as NumPy column arrays:
+
+    matches: one row per player per match (deck, number of turns, final life)
+    life:    one row per player per turn (life total at the end of that turn)
+    cards:   one row per card drawn or played (turn, card, action)
+
+Player, deck and card names are interned into integer codes so that every
+column is a plain numeric array and queries are vectorised NumPy operations.
+Rows are grouped into chunk files of STATS_CHUNK_MATCHES matches each; a
+metadata file holds the string table and the committed match count.
+
+Usage from the command line:
+
+    python match_stats.py decks
+    python match_stats.py life --deck "Boros Aggro" --turn 5
+    python match_stats.py curve --deck "Boros Aggro"
+    python match_stats.py cards --deck "Boros Aggro"
+"""
+
+import argparse
+import json
+import os
+import sys
+import numpy as np
+from config import STARTING_LIFE_TOTAL, STATS_PATH, STATS_CHUNK_MATCHES
+from utils import ensure_dir
+
+# Codes for the "action" column of the cards table, keyed by GameState event kind
+ACTION_CODES = {"draw": 0, "play": 1}
+
+# Column names and dtypes for each table
+SCHEMA = {
+    "matches": {
+        "match_id": np.int64,
+        "player": np.int32,
+        "deck": np.int32,
+        "turns": np.int16,
+        "final_life": np.int16,
+    },
+    "life": {
+        "match_id": np.int64,
+        "player": np.int32,
+        "deck": np.int32,
+        "turn": np.int16,
+        "life": np.int16,
+    },
+    "cards": {
+        "match_id": np.int64,
+        "player": np.int32,
+        "deck": np.int32,
+        "turn": np.int16,
+        "card": np.int32,
+        "action": np.int8,
+    },
+}
+
+META_FILE = "meta.json"
+
+
+def build_match_record(game_state, players_info):
+    """
+    Convert a finished game into a match record suitable for MatchStore.append_match.
+
+    Args:
+        game_state (GameState): The game state at the end of the match.
+        players_info (list of dict): Player dictionaries as returned by SetupDialog.get_setup_data().
+
+    Returns:
+        dict: {"turns": int, "players": [{"player_name", "deck_name", "life", "cards"}]},
+        where "life" holds the life total at the end of each turn and "cards" is a
+        list of (turn, card_name, action) tuples.
+    """
+    turns = game_state.turn
+    players = []
+    for info in players_info:
+        name = info["player_name"]
+        life_by_turn = [None] * turns
+        cards = []
+        for turn, player, kind, value in game_state.events:
+            if player != name:
+                continue
+            if kind in ACTION_CODES:
+                cards.append((turn, value, kind))
+            else:
+                life_by_turn[turn - 1] = value
+
+        # Carry the life total forward through turns without a life change
+        life = STARTING_LIFE_TOTAL
+        for i, value in enumerate(life_by_turn):
+            if value is None:
+                life_by_turn[i] = life
+            else:
+                life = value
+
+        players.append({
+            "player_name": name,
+            "deck_name": info["deck_name"],
+            "life": life_by_turn,
+            "cards": cards,
+        })
+    return {"turns": turns, "players": players}
+
+
+class MatchStore:
+    def __init__(self, path=STATS_PATH, chunk_matches=STATS_CHUNK_MATCHES):
+        """
+        Open (or create) a match statistics store.
+
+        Args:
+            path (str): Directory holding the store.
+            chunk_matches (int): Matches per chunk file; only used when creating a new store.
+        """
+        self.path = path
+        self._tables = None
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        else:
+            meta = {"chunk_matches": chunk_matches, "match_count": 0, "strings": []}
+        self.chunk_matches = meta["chunk_matches"]
+        self.match_count = meta["match_count"]
+        self.strings = meta["strings"]
+        self._codes = {s: i for i, s in enumerate(self.strings)}
+
+    # --------------------------
+    # Writing
+    # --------------------------
+    def append_match(self, record):
+        """
+        Append a single match record (see build_match_record) to the store.
+        """
+        self.append_matches([record])
+
+    def append_matches(self, records):
+        """
+        Append several match records to the store in one pass.
+
+        Each affected chunk file is rewritten once, so ingesting in batches is
+        much cheaper than calling append_match for every record.
+        """
+        records = list(records)
+        if not records:
+            return
+        ensure_dir(self.path)
+        start = self.match_count
+        end = start + len(records)
+        new = self._columns_from_records(records, start)
+
+        for chunk in range(start // self.chunk_matches, (end - 1) // self.chunk_matches + 1):
+            lo = max(start, chunk * self.chunk_matches)
+            hi = min(end, (chunk + 1) * self.chunk_matches)
+            existing = self._read_chunk(chunk)
+            arrays = {}
+            for table, columns in SCHEMA.items():
+                ids = new[table]["match_id"]
+                mask = (ids >= lo) & (ids < hi)
+                for column in columns:
+                    part = new[table][column][mask]
+                    if existing is not None:
+                        part = np.concatenate([existing[f"{table}.{column}"], part])
+                    arrays[f"{table}.{column}"] = part
+            self._write_chunk(chunk, arrays)
+
+        # Committing the metadata last makes the new rows visible
+        self.match_count = end
+        self._write_meta()
+        self._tables = None
+
+    def _intern(self, name):
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(name)
+            self._codes[name] = code
+        return code
+
+    def _columns_from_records(self, records, first_match_id):
+        rows = {table: {column: [] for column in columns} for table, columns in SCHEMA.items()}
+        for offset, record in enumerate(records):
+            match_id = first_match_id + offset
+            turns = record["turns"]
+            for player in record["players"]:
+                player_code = self._intern(player["player_name"])
+                deck_code = self._intern(player["deck_name"])
+                life = player["life"]
+
+                matches = rows["matches"]
+                matches["match_id"].append(match_id)
+                matches["player"].append(player_code)
+                matches["deck"].append(deck_code)
+                matches["turns"].append(turns)
+                matches["final_life"].append(life[-1] if life else STARTING_LIFE_TOTAL)
+
+                life_rows = rows["life"]
+                life_rows["match_id"].extend([match_id] * len(life))
+                life_rows["player"].extend([player_code] * len(life))
+                life_rows["deck"].extend([deck_code] * len(life))
+                life_rows["turn"].extend(range(1, len(life) + 1))
+                life_rows["life"].extend(life)
+
+                card_rows = rows["cards"]
+                for turn, card_name, action in player["cards"]:
+                    card_rows["match_id"].append(match_id)
+                    card_rows["player"].append(player_code)
+                    card_rows["deck"].append(deck_code)
+                    card_rows["turn"].append(turn)
+                    card_rows["card"].append(self._intern(card_name))
+                    card_rows["action"].append(ACTION_CODES[action])
+
+        return {
+            table: {column: np.asarray(rows[table][column], dtype=dtype) for column, dtype in columns.items()}
+            for table, columns in SCHEMA.items()
+        }
+
+    def _chunk_path(self, chunk):
+        return os.path.join(self.path, f"chunk_{chunk:06d}.npz")
+
+    def _read_chunk(self, chunk):
+        """
+        Load a chunk file, dropping any rows beyond the committed match count
+        (left behind if a previous write was interrupted). Returns None if the
+        chunk does not exist.
+        """
+        chunk_path = self._chunk_path(chunk)
+        if not os.path.exists(chunk_path):
+            return None
+        with np.load(chunk_path) as data:
+            arrays = {key: data[key] for key in data.files}
+        for table, columns in SCHEMA.items():
+            keep = arrays[f"{table}.match_id"] < self.match_count
+            if not keep.all():
+                for column in columns:
+                    arrays[f"{table}.{column}"] = arrays[f"{table}.{column}"][keep]
+        return arrays
+
+    def _write_chunk(self, chunk, arrays):
+        chunk_path = self._chunk_path(chunk)
+        tmp_path = chunk_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, chunk_path)
+
+    def _write_meta(self):
+        meta_path = os.path.join(self.path, META_FILE)
+        tmp_path = meta_path + ".tmp"
+        meta = {
+            "chunk_matches": self.chunk_matches,
+            "match_count": self.match_count,
+            "strings": self.strings,
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    # --------------------------
+    # Querying
+    # --------------------------
+    def tables(self):
+        """
+        Return every table as a dict of concatenated column arrays, loading the
+        chunk files on first use.
+        """
+        if self._tables is None:
+            n_chunks = -(-self.match_count // self.chunk_matches)
+            chunks = [self._read_chunk(chunk) for chunk in range(n_chunks)]
+            chunks = [c for c in chunks if c is not None]
+            self._tables = {}
+            for table, columns in SCHEMA.items():
+                self._tables[table] = {
+                    column: np.concatenate([c[f"{table}.{column}"] for c in chunks])
+                    if chunks else np.empty(0, dtype=dtype)
+                    for column, dtype in columns.items()
+                }
+        return self._tables
+
+    def code(self, name):
+        """
+        Return the integer code for a player, deck or card name, or -1 if unknown.
+        """
+        return self._codes.get(name, -1)
+
+    def deck_summary(self):
+        """
+        Summarise every deck in the store.
+
+        Returns:
+            list of dict: One entry per deck with "deck", "matches",
+            "avg_turns" and "avg_final_life", sorted by number of matches.
+        """
+        matches = self.tables()["matches"]
+        n = len(self.strings)
+        counts = np.bincount(matches["deck"], minlength=n)
+        turns = np.bincount(matches["deck"], weights=matches["turns"], minlength=n)
+        final_life = np.bincount(matches["deck"], weights=matches["final_life"], minlength=n)
+        summary = []
+        for code in np.flatnonzero(counts):
+            summary.append({
+                "deck": self.strings[code],
+                "matches": int(counts[code]),
+                "avg_turns": turns[code] / counts[code],
+                "avg_final_life": final_life[code] / counts[code],
+            })
+        summary.sort(key=lambda row: row["matches"], reverse=True)
+        return summary
+
+    def average_life_at_turn(self, deck_name, turn):
+        """
+        Average life total at the end of the given turn for a deck, over all
+        matches that lasted at least that long. Returns None if there is no data.
+        """
+        life = self.tables()["life"]
+        mask = (life["deck"] == self.code(deck_name)) & (life["turn"] == turn)
+        if not mask.any():
+            return None
+        return float(life["life"][mask].mean())
+
+    def life_curve(self, deck_name):
+        """
+        Average life total per turn for a deck.
+
+        Returns:
+            tuple: (turns, average_life, samples) arrays covering every turn with data.
+        """
+        life = self.tables()["life"]
+        mask = life["deck"] == self.code(deck_name)
+        turns = life["turn"][mask]
+        samples = np.bincount(turns)
+        totals = np.bincount(turns, weights=life["life"][mask])
+        present = np.flatnonzero(samples)
+        return present, totals[present] / samples[present], samples[present]
+
+    def card_stats(self, deck_name=None):
+        """
+        Per-card draw and play counts, optionally restricted to a single deck.
+
+        Returns:
+            list of dict: One entry per card with "card", "drawn", "played" and
+            "avg_play_turn" (None if never played), sorted by times played.
+        """
+        cards = self.tables()["cards"]
+        card = cards["card"]
+        action = cards["action"]
+        turn = cards["turn"]
+        if deck_name is not None:
+            mask = cards["deck"] == self.code(deck_name)
+            card, action, turn = card[mask], action[mask], turn[mask]
+
+        n = len(self.strings)
+        played = action == ACTION_CODES["play"]
+        drawn_counts = np.bincount(card[action == ACTION_CODES["draw"]], minlength=n)
+        played_counts = np.bincount(card[played], minlength=n)
+        play_turns = np.bincount(card[played], weights=turn[played], minlength=n)
+
+        stats = []
+        for code in np.flatnonzero(drawn_counts + played_counts):
+            stats.append({
+                "card": self.strings[code],
+                "drawn": int(drawn_counts[code]),
+                "played": int(played_counts[code]),
+                "avg_play_turn": play_turns[code] / played_counts[code] if played_counts[code] else None,
+            })
+        stats.sort(key=lambda row: row["played"], reverse=True)
+        return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the match statistics store.")
+    parser.add_argument("--store", default=STATS_PATH, help="Path to the statistics store directory.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("decks", help="Summarise every deck in the store.")
+
+    life_parser = subparsers.add_parser("life", help="Average life at a given turn for a deck.")
+    life_parser.add_argument("--deck", required=True)
+    life_parser.add_argument("--turn", type=int, required=True)
+
+    curve_parser = subparsers.add_parser("curve", help="Average life per turn for a deck.")
+    curve_parser.add_argument("--deck", required=True)
+
+    cards_parser = subparsers.add_parser("cards", help="Draw/play counts per card.")
+    cards_parser.add_argument("--deck", default=None)
+
+    args = parser.parse_args(argv)
+    store = MatchStore(args.store)
+    if store.match_count == 0:
+        print(f"No matches recorded in {args.store}")
+        return 1
+
+    if args.command == "decks":
+        print(f"{'Deck':<30} {'Matches':>8} {'Avg Turns':>10} {'Avg Final Life':>15}")
+        for row in store.deck_summary():
+            print(f"{row['deck']:<30} {row['matches']:>8} {row['avg_turns']:>10.2f} {row['avg_final_life']:>15.2f}")
+    elif args.command == "life":
+        average = store.average_life_at_turn(args.deck, args.turn)
+        if average is None:
+            print(f"No data for deck '{args.deck}' at turn {args.turn}")
+            return 1
+        print(f"Average life for '{args.deck}' at turn {args.turn}: {average:.2f}")
+    elif args.command == "curve":
+        turns, average, samples = store.life_curve(args.deck)
+        if not len(turns):
+            print(f"No data for deck '{args.deck}'")
+            return 1
+        print(f"{'Turn':>4} {'Avg Life':>9} {'Samples':>8}")
+        for turn, life, count in zip(turns, average, samples):
+            print(f"{turn:>4} {life:>9.2f} {count:>8}")
+    elif args.command == "cards":
+        print(f"{'Card':<30} {'Drawn':>7} {'Played':>7} {'Avg Play Turn':>14}")
+        for row in store.card_stats(args.deck):
+            avg_turn = f"{row['avg_play_turn']:.2f}" if row["avg_play_turn"] is not None else "-"
+            print(f"{row['card']:<30} {row['drawn']:>7} {row['played']:>7} {avg_turn:>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@
 This module defines the PlayerWindow class.
 Each instance represents an interactive touch-screen panel for a player,
 allowing them to add cards to their hand by selecting from the decklist,
-remove played cards, and view/update their current life total.
+remove played cards, view/update their current life total and advance the turn.
 """
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListWidget, QPushButton, QLabel, QComboBox, QHBoxLayout
@@ -52,6 +52,15 @@ class PlayerWindow(QWidget):
         life_buttons_layout.addWidget(self.decrease_life_btn)
         self.layout.addLayout(life_buttons_layout)
 
+        # Current turn and a button to advance it (shared by all players)
+        turn_layout = QHBoxLayout()
+        self.turn_label = QLabel(f"Turn: {self.game_state.turn}")
+        turn_layout.addWidget(self.turn_label)
+        next_turn_btn = QPushButton("Next Turn")
+        next_turn_btn.clicked.connect(self.game_state.next_turn)
+        turn_layout.addWidget(next_turn_btn)
+        self.layout.addLayout(turn_layout)
+
         # Label for the hand section
         self.hand_label = QLabel("Your Hand:")
         self.layout.addWidget(self.hand_label)
@@ -109,3 +118,4 @@ class PlayerWindow(QWidget):
         for card in self.game_state.hands[self.player_name]:
             self.hand_list.addItem(card)
         self.life_label.setText(f"Life Total: {self.game_state.life_totals[self.player_name]}")
+        self.turn_label.setText(f"Turn: {self.game_state.turn}")